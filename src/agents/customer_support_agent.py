@@ -1,9 +1,12 @@
 """Customer support agent with knowledge base search capability."""
 
 import sys
+import threading
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from strands import Agent
 from strands.hooks import (
@@ -13,18 +16,52 @@ from strands.hooks import (
     HookRegistry,
 )
 
-from src.models import ModelType, create_bedrock_model
-from src.tools.knowledge_search import search_knowledge_base, set_knowledge_directory
+from src.models import ModelType, get_shared_model
+
+if TYPE_CHECKING:
+    from src.cache.semantic_cache import SemanticCache
+
+
+# Streaming output buffer thresholds: flush when this much text has
+# accumulated or this much time has passed since the last flush.
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_INTERVAL = 0.016
 
 
 class ProgressCallbackHandler:
-    """Callback handler that shows progress indicators during agent processing."""
+    """Callback handler that shows progress indicators during agent processing.
+
+    Streamed text is buffered and flushed in batches instead of issuing a
+    write + flush syscall per token, which dominates at high token rates.
+    """
 
     def __init__(self) -> None:
         """Initialize the callback handler."""
         self._is_thinking = False
         self._current_tool: str | None = None
         self._text_started = False
+        self._buffer: list[str] = []
+        self._buffered_chars = 0
+        self._last_flush = 0.0
+        self._response_parts: list[str] = []
+
+    @property
+    def text(self) -> str:
+        """The full text streamed during the most recent event loop cycle.
+
+        Callers that already streamed the answer can read this instead of
+        re-serializing the agent result object.
+        """
+        return "".join(self._response_parts)
+
+    def _flush_buffer(self) -> None:
+        """Write any buffered streamed text to stdout."""
+        if self._buffer:
+            sys.stdout.write("".join(self._buffer))
+            sys.stdout.flush()
+            self._buffer.clear()
+            self._buffered_chars = 0
+        self._last_flush = time.monotonic()
 
     def _clear_status(self) -> None:
         """Clear the current status line."""
@@ -34,8 +71,8 @@ class ProgressCallbackHandler:
 
     def _show_status(self, message: str) -> None:
         """Show a status message on the current line."""
-        self._clear_status()
-        sys.stdout.write(f"\r⏳ {message}")
+        # Clear-line sequence and message in one write/flush pair
+        sys.stdout.write(f"\r\033[K\r⏳ {message}")
         sys.stdout.flush()
 
     def __call__(self, **kwargs) -> None:
@@ -48,6 +85,7 @@ class ProgressCallbackHandler:
         if kwargs.get("init_event_loop", False):
             self._is_thinking = True
             self._text_started = False
+            self._response_parts = []
             self._show_status("回答を準備しております...")
 
         # Tool usage started
@@ -58,19 +96,27 @@ class ProgressCallbackHandler:
                 self._current_tool = tool_name
                 self._show_status("関連情報を確認しております...")
 
-        # Text generation started - clear status and print text
+        # Text generation started - clear status and buffer text
         if "data" in kwargs:
             if self._is_thinking or self._current_tool:
                 self._clear_status()
                 self._is_thinking = False
                 self._current_tool = None
-            # Print the streaming text
-            sys.stdout.write(kwargs["data"])
-            sys.stdout.flush()
+            # Buffer the streaming text; flush on size or time threshold
+            data = kwargs["data"]
+            self._buffer.append(data)
+            self._buffered_chars += len(data)
+            self._response_parts.append(data)
+            if (
+                self._buffered_chars >= STREAM_FLUSH_CHARS
+                or time.monotonic() - self._last_flush >= STREAM_FLUSH_INTERVAL
+            ):
+                self._flush_buffer()
             self._text_started = True
 
         # Event loop completed
         if kwargs.get("complete", False):
+            self._flush_buffer()
             if self._is_thinking or self._current_tool:
                 self._clear_status()
             self._is_thinking = False
@@ -81,18 +127,41 @@ class ProgressCallbackHandler:
                 sys.stdout.flush()
 
 
+@dataclass(slots=True)
+class _ToolUseRecord:
+    """Internal record of a single tool invocation.
+
+    Slotted to keep per-record memory low on eval runs with many turns.
+
+    Attributes:
+        tool_name: Name of the invoked tool.
+        tool_input: Input parameters passed to the tool.
+        tool_output: The string output returned by the tool.
+    """
+
+    tool_name: str
+    tool_input: dict[str, Any]
+    tool_output: str
+
+
 class ToolUsageTracker(HookProvider):
     """Hook provider that tracks tool usage during agent execution.
 
     This class captures tool names, inputs, and outputs for each tool invocation
     during agent execution. The collected data can be retrieved and cleared
     using the get_and_clear() method.
+
+    Records are kept in the order the LLM issued the tool calls, even when
+    the agent executes tool calls concurrently and completion events arrive
+    out of order.
     """
 
     def __init__(self) -> None:
         """Initialize the tool usage tracker."""
-        self._pending: dict[str, dict[str, Any]] = {}  # toolUseId -> {name, input}
-        self._tool_uses: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # toolUseId -> (name, input, slot)
+        self._pending: dict[str, tuple[str, dict[str, Any], int]] = {}
+        self._tool_uses: list[_ToolUseRecord | None] = []
 
     def register_hooks(self, registry: HookRegistry) -> None:
         """Register hook callbacks for tool events.
@@ -106,14 +175,20 @@ class ToolUsageTracker(HookProvider):
     def _on_before_tool(self, event: BeforeToolCallEvent) -> None:
         """Capture tool name and input before execution.
 
+        Reserves a slot in the result list so records end up in call order
+        regardless of completion order.
+
         Args:
             event: The before tool call event.
         """
         tool_use_id = event.tool_use.get("toolUseId", "")
-        self._pending[tool_use_id] = {
-            "name": event.tool_use.get("name", ""),
-            "input": event.tool_use.get("input", {}),
-        }
+        with self._lock:
+            self._pending[tool_use_id] = (
+                event.tool_use.get("name", ""),
+                event.tool_use.get("input", {}),
+                len(self._tool_uses),
+            )
+            self._tool_uses.append(None)
 
     def _on_after_tool(self, event: AfterToolCallEvent) -> None:
         """Capture tool output after execution.
@@ -122,66 +197,67 @@ class ToolUsageTracker(HookProvider):
             event: The after tool call event.
         """
         tool_use_id = event.tool_use.get("toolUseId", "")
-        if tool_use_id in self._pending:
-            pending = self._pending.pop(tool_use_id)
+        with self._lock:
+            # Single hash lookup instead of a membership check followed by pop
+            pending = self._pending.pop(tool_use_id, None)
+            if pending is None:
+                return
+            name, tool_input, slot = pending
             output = ""
             if event.result and "content" in event.result:
                 for block in event.result["content"]:
                     if "text" in block:
                         output = block["text"]
                         break
-            self._tool_uses.append(
-                {
-                    "tool_name": pending["name"],
-                    "tool_input": pending["input"],
-                    "tool_output": output,
-                }
-            )
+            self._tool_uses[slot] = _ToolUseRecord(name, tool_input, output)
 
     def get_and_clear(self) -> list[dict[str, Any]]:
         """Get all recorded tool uses and clear the internal state.
 
         Returns:
-            List of dictionaries containing tool_name, tool_input, and tool_output.
+            List of dictionaries containing tool_name, tool_input, and tool_output,
+            in the order the tool calls were issued. Slots for calls that never
+            completed are dropped.
         """
-        result = self._tool_uses.copy()
-        self._tool_uses = []
-        self._pending = {}
-        return result
-
-
-# System prompt for the customer support agent
+        with self._lock:
+            records = self._tool_uses
+            self._tool_uses = []
+            # clear() keeps the dict's allocated hash table for the next turn
+            self._pending.clear()
+        # Convert to dicts only at the boundary, off the hot event path
+        return [
+            {
+                "tool_name": record.tool_name,
+                "tool_input": record.tool_input,
+                "tool_output": record.tool_output,
+            }
+            for record in records
+            if record is not None
+        ]
+
+
+# System prompt for the customer support agent.
+# Kept deliberately compact: every token here is re-tokenized on each
+# first-turn prefill, so instructions are merged where meaning allows.
 CUSTOMER_SUPPORT_SYSTEM_PROMPT = """あなたは親切で丁寧なカスタマーサポート担当者です。
 
-## 役割
+## 役割と行動指針
 お客様からの問い合わせに対して、ナレッジベースを検索し、正確で役立つ情報を提供します。
-
-## 行動指針
-1. まずお客様の質問を理解し、適切なキーワードでナレッジベースを検索してください
+1. お客様の質問を理解し、適切なキーワードでナレッジベースを検索してください
 2. 検索結果に基づいて、明確で分かりやすい回答を提供してください
-3. 検索結果に該当する情報がない場合は、正直にその旨を伝え、
-   カスタマーサポートへの直接連絡を案内してください
+3. 該当する情報がない場合は正直にその旨を伝え、\
+カスタマーサポートへの直接連絡を案内してください
 4. 常に敬語を使用し、お客様に寄り添った対応を心がけてください
 
 ## 条件分岐がある場合の対応（重要）
-検索結果に条件によって異なる対応が含まれている場合（例：個人/法人、保証期間内/外、購入日数など）：
-
-1. **すべての条件を一度に説明しないでください**
-2. まず、お客様がどの条件に該当するかを特定するための質問をしてください
-   - 例：「個人のお客様でしょうか、法人のお客様でしょうか？」
-   - 例：「ご購入からどれくらい経過されていますか？」
-   - 例：「製品は未開封の状態でしょうか？」
-3. お客様の回答を受けてから、**該当する条件の情報のみ**をピンポイントで回答してください
-4. 該当しない条件の情報は提供しないでください
-
-### 条件確認の例
-❌ 悪い例：「個人の場合は〇〇、法人の場合は△△です」（すべて列挙）
-✅ 良い例：「個人のお客様でしょうか、法人のお客様でしょうか？」
-   → 回答を受けて該当部分のみ説明
+検索結果に条件によって異なる対応が含まれる場合（例：個人/法人、保証期間内/外、購入日数など）、
+すべての条件を一度に列挙しないでください。
+まず「個人のお客様でしょうか、法人のお客様でしょうか？」のように、
+お客様がどの条件に該当するかを特定する質問をし、
+回答を受けてから**該当する条件の情報のみ**をピンポイントで説明してください。
 
 ## 回答のフォーマット
-- 簡潔で分かりやすい文章で回答してください
-- 必要に応じて箇条書きを使用してください
+- 簡潔で分かりやすい文章で回答し、必要に応じて箇条書きを使用してください
 - 具体的な手順がある場合は、ステップバイステップで説明してください
 """
 
@@ -190,6 +266,7 @@ def create_customer_support_agent(
     knowledge_dir: Path | str | None = None,
     callback_handler: Callable[..., Any] | None = None,
     tool_tracker: ToolUsageTracker | None = None,
+    model_type: ModelType = ModelType.SONNET,
 ) -> Agent:
     """Create a customer support agent with knowledge base search capability.
 
@@ -198,10 +275,21 @@ def create_customer_support_agent(
         callback_handler: Optional callback handler for streaming output.
             Pass None to disable console output.
         tool_tracker: Optional ToolUsageTracker to capture tool usage information.
+        model_type: Model to use for responses. Defaults to Sonnet; pass
+            ModelType.HAIKU for a cheaper, lower-latency agent on workloads
+            that do not need Sonnet-class answer quality.
 
     Returns:
         Configured customer support agent.
     """
+    # Imported here so module import stays light: the knowledge search
+    # tool pulls in boto3 and numpy, which are only needed once an agent
+    # is actually created.
+    from src.tools.knowledge_search import (
+        search_knowledge_base,
+        set_knowledge_directory,
+    )
+
     # Set knowledge directory
     if knowledge_dir is not None:
         set_knowledge_directory(knowledge_dir)
@@ -210,8 +298,10 @@ def create_customer_support_agent(
         project_root = Path(__file__).parent.parent.parent
         set_knowledge_directory(project_root / "knowledge")
 
-    # Create Bedrock model with Claude Sonnet 4.5 (global inference)
-    model = create_bedrock_model(ModelType.SONNET)
+    # Reuse the shared Bedrock model: agents hold per-conversation state and
+    # must stay per-scenario, but the model (and its HTTP client pool) is
+    # stateless and safe to share.
+    model = get_shared_model(model_type)
 
     # Set up hooks for tool tracking
     hooks: list[HookProvider] = [tool_tracker] if tool_tracker else []
@@ -228,17 +318,59 @@ def create_customer_support_agent(
     return agent
 
 
-def get_customer_support_response(agent: Agent, user_message: str) -> str:
+def get_customer_support_response(
+    agent: Agent,
+    user_message: str,
+    cache: "SemanticCache | None" = None,
+) -> str:
     """Get a response from the customer support agent.
 
     Args:
         agent: The customer support agent instance.
         user_message: The user's message/question.
+        cache: Optional semantic cache. When provided, near-duplicate
+            questions are answered from the cache without calling Bedrock.
+            Only use a cache for single-turn lookups; cached answers do not
+            reflect conversation context.
 
     Returns:
         The agent's response as a string.
     """
+    if cache is not None:
+        cached = cache.lookup(user_message)
+        if cached is not None:
+            return cached
+
     result = agent(user_message)
+
+    # If a ProgressCallbackHandler already streamed the answer, reuse the
+    # accumulated text instead of re-serializing the result object.
+    handler = getattr(agent, "callback_handler", None)
+    if isinstance(handler, ProgressCallbackHandler) and handler.text:
+        response = handler.text
+    else:
+        response = str(result)
+
+    if cache is not None:
+        cache.put(user_message, response)
+
+    return response
+
+
+async def get_customer_support_response_async(agent: Agent, user_message: str) -> str:
+    """Get a response from the customer support agent asynchronously.
+
+    Allows multiple scenarios' in-flight turns to be awaited concurrently
+    (e.g. via asyncio.gather) instead of serializing on each Bedrock call.
+
+    Args:
+        agent: The customer support agent instance.
+        user_message: The user's message/question.
+
+    Returns:
+        The agent's response as a string.
+    """
+    result = await agent.invoke_async(user_message)
     return str(result)
 
 
@@ -1,12 +1,17 @@
 """Simulated user agent for testing customer support agents."""
 
-from collections.abc import Callable
+import string
+import sys
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from strands import Agent
 
+from src.models import ModelType, get_shared_model
+
 
 class UserPersona(Enum):
     """Different user personas for simulation."""
@@ -18,10 +23,13 @@ class UserPersona(Enum):
     CURT = "curt"  # ぶっきらぼうで言葉足らずな顧客
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserScenario:
     """Scenario for user simulation.
 
+    Frozen and slotted: instances are hashable (so they can key prompt
+    caches), smaller, and safe to share across threads.
+
     Attributes:
         persona: The user persona type.
         initial_query: The initial question/problem.
@@ -103,34 +111,57 @@ PERSONA_PROMPTS: dict[UserPersona, str] = {
 """,
 }
 
+# Canonicalize persona prompts (exactly one trailing newline) so the persona
+# block stays a byte-stable prefix across all scenarios sharing a persona.
+# A stable prefix maximizes prompt prefix-cache reuse on the serving side.
+# Interning gives every consumer the same string object, so downstream
+# caches can compare prompts by pointer instead of by content.
+PERSONA_PROMPTS = {
+    persona: sys.intern(prompt.rstrip("\n") + "\n")
+    for persona, prompt in PERSONA_PROMPTS.items()
+}
 
-def _build_scenario_prompt(scenario: UserScenario) -> str:
-    """Build the complete system prompt for a scenario.
-
-    Args:
-        scenario: The user scenario.
 
-    Returns:
-        Complete system prompt combining persona and scenario.
+# Scenario section template, compiled once at import time
+_SCENARIO_SECTION_TEMPLATE = string.Template(
     """
-    persona_prompt = PERSONA_PROMPTS[scenario.persona]
-
-    scenario_section = f"""
 ## あなたのシナリオ
-- 目的: {scenario.goal}
-- 状況: {scenario.context if scenario.context else "特になし"}
+- 目的: $goal
+- 状況: $context
 
 ## 重要な制約
-- 最大{scenario.max_turns}回のやり取りで目的を達成してください
+- 最大$max_turns回のやり取りで目的を達成してください
 - 目的が達成されたら「ありがとうございました」と締めくくってください
 - カスタマーサポートの回答に対して自然に反応してください
 - あなたは顧客役なので、自分で問題を解決しようとしないでください
 
 ## 最初の発言
 会話の最初のターンでは、以下の質問から始めてください：
-「{scenario.initial_query}」
+「$initial_query」
 """
-    return persona_prompt + scenario_section
+)
+
+
+@lru_cache(maxsize=256)
+def _build_scenario_prompt(scenario: UserScenario) -> str:
+    """Build the complete system prompt for a scenario.
+
+    Cached on the (hashable) scenario, so identical scenarios across
+    repeated eval runs reuse the exact same string object.
+
+    Args:
+        scenario: The user scenario.
+
+    Returns:
+        Complete system prompt combining persona and scenario.
+    """
+    scenario_section = _SCENARIO_SECTION_TEMPLATE.substitute(
+        goal=scenario.goal,
+        context=scenario.context if scenario.context else "特になし",
+        max_turns=scenario.max_turns,
+        initial_query=scenario.initial_query,
+    )
+    return PERSONA_PROMPTS[scenario.persona] + scenario_section
 
 
 def create_simulated_user_agent(
@@ -149,7 +180,11 @@ def create_simulated_user_agent(
     """
     system_prompt = _build_scenario_prompt(scenario)
 
+    # Agents carry per-conversation history and must stay per-scenario,
+    # but the Bedrock model (client pool, config) is stateless: sharing
+    # it avoids re-initializing a model per simulated user.
     agent = Agent(
+        model=get_shared_model(ModelType.SONNET),
         system_prompt=system_prompt,
         tools=[],  # Simulated user doesn't need tools
         callback_handler=callback_handler,
@@ -158,26 +193,76 @@ def create_simulated_user_agent(
     return agent
 
 
-def get_simulated_user_response(agent: Agent, support_response: str) -> str:
-    """Get a response from the simulated user agent.
+def _build_user_turn_prompt(support_response: str) -> str:
+    """Build the prompt for a simulated user turn.
 
     Args:
-        agent: The simulated user agent instance.
         support_response: The customer support agent's response.
 
     Returns:
-        The simulated user's response as a string.
+        Prompt asking the simulated user to respond in character.
     """
-    prompt = f"""カスタマーサポートからの回答:
+    return f"""カスタマーサポートからの回答:
 {support_response}
 
 上記の回答を受けて、あなたの役割に沿った自然な返答をしてください。
 目的が達成されたと感じたら、感謝を述べて会話を終えてください。
 """
-    result = agent(prompt)
+
+
+def get_simulated_user_response(agent: Agent, support_response: str) -> str:
+    """Get a response from the simulated user agent.
+
+    Args:
+        agent: The simulated user agent instance.
+        support_response: The customer support agent's response.
+
+    Returns:
+        The simulated user's response as a string.
+    """
+    result = agent(_build_user_turn_prompt(support_response))
+    return str(result)
+
+
+async def get_simulated_user_response_async(agent: Agent, support_response: str) -> str:
+    """Get a response from the simulated user agent asynchronously.
+
+    Enables concurrent scheduling of simulated user turns across scenarios
+    when driven from an asyncio event loop.
+
+    Args:
+        agent: The simulated user agent instance.
+        support_response: The customer support agent's response.
+
+    Returns:
+        The simulated user's response as a string.
+    """
+    result = await agent.invoke_async(_build_user_turn_prompt(support_response))
     return str(result)
 
 
+async def stream_simulated_user_response_async(
+    agent: Agent, support_response: str
+) -> AsyncIterator[str]:
+    """Stream a simulated user response as incremental text chunks.
+
+    Yields text deltas as they are decoded. A driver can watch the stream
+    for a closing phrase (e.g. 「ありがとうございました」) and kick off the
+    next support-agent call while the tail of this response is still
+    flushing, instead of waiting for the full decode to finish.
+
+    Args:
+        agent: The simulated user agent instance.
+        support_response: The customer support agent's response.
+
+    Yields:
+        Text chunks of the simulated user's response, in order.
+    """
+    async for event in agent.stream_async(_build_user_turn_prompt(support_response)):
+        if "data" in event:
+            yield event["data"]
+
+
 # Pre-defined test scenarios
 SAMPLE_SCENARIOS: list[UserScenario] = [
     UserScenario(
@@ -1,47 +1,94 @@
 """HTML dashboard generator for evaluation results."""
 
-import html
+import io
 import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
+from typing import TextIO
 
 from src.evaluation.evaluator import (
     PARTIAL_THRESHOLD,
     PASS_THRESHOLD,
+    ConversationTurn,
     EvaluationResult,
+    ToolUsage,
+)
+
+# Translation table for HTML escaping: one C-level pass over the string
+# instead of html.escape's five chained str.replace passes.
+_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&#x27;",
+    }
 )
 
 
 def _escape_html(text: str) -> str:
     """Escape HTML special characters."""
-    return html.escape(text)
+    # Fast path: most messages and tool outputs contain none of the five
+    # special characters. Each `in` check is a single C-level scan that
+    # bails on first hit, skipping the translate pass (and its
+    # allocation) entirely on clean text.
+    if (
+        "&" not in text
+        and "<" not in text
+        and ">" not in text
+        and '"' not in text
+        and "'" not in text
+    ):
+        return text
+    return text.translate(_ESCAPE_TABLE)
 
 
 def _format_message_html(message: str) -> str:
     """Format a message for HTML display with proper line breaks."""
     escaped = _escape_html(message)
-    # Convert newlines to <br> tags
+    # Convert newlines to <br> tags (skip the replace on single-line text)
+    if "\n" not in escaped:
+        return escaped
     return escaped.replace("\n", "<br>")
 
 
+# Shared status (CSS class, label) tuples so every row reuses the same
+# objects instead of rebuilding them per scenario
+_STATUS_PASS = ("pass", "PASS")
+_STATUS_PARTIAL = ("partial", "PARTIAL")
+_STATUS_FAIL = ("fail", "FAIL")
+
+# Bound format methods: the format spec is parsed once here instead of
+# on every f-string evaluation in the per-scenario path.
+_fmt_pct = "{:.0%}".format
+_fmt_f1 = "{:.1f}".format
+
+# LLM score badge CSS classes indexed by score (1-5 scale):
+# >= 4 is high, 3 is medium, below that low.
+_LLM_SCORE_CLASSES = ("low", "low", "low", "medium", "high", "high")
+
+
+def _get_status(score: float) -> tuple[str, str]:
+    """Get the (CSS class, label) pair for a score."""
+    if score >= PASS_THRESHOLD:
+        return _STATUS_PASS
+    if score >= PARTIAL_THRESHOLD:
+        return _STATUS_PARTIAL
+    return _STATUS_FAIL
+
+
 def _get_status_class(score: float) -> str:
     """Get CSS class based on score."""
-    if score >= PASS_THRESHOLD:
-        return "pass"
-    elif score >= PARTIAL_THRESHOLD:
-        return "partial"
-    else:
-        return "fail"
+    return _get_status(score)[0]
 
 
 def _get_status_label(score: float) -> str:
     """Get status label based on score."""
-    if score >= PASS_THRESHOLD:
-        return "PASS"
-    elif score >= PARTIAL_THRESHOLD:
-        return "PARTIAL"
-    else:
-        return "FAIL"
+    return _get_status(score)[1]
 
 
 def _render_context_html(context: str) -> str:
@@ -60,232 +107,10 @@ def _render_goal_html(goal: str) -> str:
     return f'<div class="meta-item"><strong>Goal:</strong> {escaped}</div>'
 
 
-def generate_dashboard_html(
-    results: list[EvaluationResult],
-    title: str = "Agent Evaluation Dashboard",
-) -> str:
-    """Generate HTML dashboard for evaluation results.
-
-    Args:
-        results: List of evaluation results.
-        title: Dashboard title.
-
-    Returns:
-        HTML string for the dashboard.
-    """
-    # Sort results by scenario_number (ascending), placing None values at the end
-    sorted_results = sorted(
-        results,
-        key=lambda r: (
-            r.scenario.scenario_number is None,
-            r.scenario.scenario_number if r.scenario.scenario_number is not None else 0,
-        ),
-    )
-
-    # Calculate summary statistics
-    total = len(results)
-    passed = sum(1 for r in results if r.score >= PASS_THRESHOLD)
-    failed = total - passed
-    avg_score = sum(r.score for r in results) / total if total > 0 else 0
-    avg_turns = sum(r.turn_count for r in results) / total if total > 0 else 0
-    natural_ends = sum(1 for r in results if r.conversation.natural_end)
-
-    # Generate scenario cards
-    scenario_cards = []
-    for i, result in enumerate(sorted_results):
-        status_class = _get_status_class(result.score)
-        status_label = _get_status_label(result.score)
-
-        # Generate conversation HTML
-        conversation_html = []
-        tool_use_counter = 0
-        for turn in result.conversation.turns:
-            role_class = "user" if turn.role == "user" else "agent"
-            role_label = "User" if turn.role == "user" else "Agent"
-            message_html = _format_message_html(turn.message)
-
-            # Generate tool usage HTML for this turn
-            tool_uses_html = ""
-            tool_count_badge = ""
-            if turn.tool_uses:
-                tool_count = len(turn.tool_uses)
-                tool_count_badge = (
-                    f'<span class="tool-count" '
-                    f"onclick=\"toggleTools(event, 'tools-{i}-{tool_use_counter}')\">"
-                    f"🔧 {tool_count} tool{'s' if tool_count > 1 else ''}</span>"
-                )
-
-                tool_items = []
-                for tu in turn.tool_uses:
-                    escaped_input = _escape_html(
-                        json.dumps(tu.tool_input, ensure_ascii=False, indent=2)
-                    )
-                    escaped_output = _escape_html(tu.tool_output)
-                    tool_name_escaped = _escape_html(tu.tool_name)
-                    tool_items.append(f"""
-                        <div class="tool-use">
-                            <div class="tool-header">
-                                <span class="tool-name">{tool_name_escaped}</span>
-                            </div>
-                            <div class="tool-detail">
-                                <div class="tool-input">
-                                    <strong>Input:</strong>
-                                    <pre>{escaped_input}</pre>
-                                </div>
-                                <div class="tool-output">
-                                    <strong>Output:</strong>
-                                    <pre>{escaped_output}</pre>
-                                </div>
-                            </div>
-                        </div>
-                    """)
-
-                tool_uses_html = f"""
-                    <div class="tool-uses" id="tools-{i}-{tool_use_counter}">
-                        {"".join(tool_items)}
-                    </div>
-                """
-                tool_use_counter += 1
-
-            conversation_html.append(f"""
-                <div class="message {role_class}">
-                    <div class="message-header">
-                        <span class="role">{role_label}</span>
-                        <span class="turn">Turn {turn.turn_number}</span>
-                        {tool_count_badge}
-                    </div>
-                    {tool_uses_html}
-                    <div class="message-content">{message_html}</div>
-                </div>
-            """)
-
-        # Topics HTML
-        covered_html = "".join(
-            f'<span class="topic covered">{_escape_html(t)}</span>'
-            for t in result.topics_covered
-        )
-        missing_html = "".join(
-            f'<span class="topic missing">{_escape_html(t)}</span>'
-            for t in result.topics_missing
-        )
-
-        # Natural end indicator
-        natural_indicator = (
-            '<span class="natural-end">Natural End</span>'
-            if result.conversation.natural_end
-            else ""
-        )
-
-        # Error message if any
-        error_html = ""
-        if result.conversation.error:
-            error_html = f"""
-                <div class="error-message">
-                    <strong>Error:</strong> {_escape_html(result.conversation.error)}
-                </div>
-            """
-
-        # LLM evaluation section
-        llm_eval_html = ""
-        llm_score_badge = ""
-        if result.llm_evaluation:
-            llm_score = result.llm_evaluation.score
-            llm_score_class = (
-                "high" if llm_score >= 4 else "medium" if llm_score >= 3 else "low"
-            )
-            llm_score_badge = (
-                f'<span class="llm-score {llm_score_class}">{llm_score}/5</span>'
-            )
-            llm_eval_html = f"""
-                <div class="llm-evaluation-section">
-                    <h4>LLM Evaluation</h4>
-                    <div class="llm-score-display {llm_score_class}">
-                        <span class="llm-score-value">{llm_score}</span>
-                        <span class="llm-score-max">/5</span>
-                    </div>
-                    <div class="llm-comment">
-                        {_format_message_html(result.llm_evaluation.comment)}
-                    </div>
-                </div>
-            """
-
-        # Format scenario title with number
-        scenario_title = (
-            f"#{result.scenario.scenario_number} {result.scenario.name}"
-            if result.scenario.scenario_number is not None
-            else result.scenario.name
-        )
-
-        scenario_cards.append(f"""
-            <div class="scenario-card {status_class}" id="scenario-{i}">
-                <div class="scenario-header" onclick="toggleScenario({i})">
-                    <div class="scenario-title">
-                        <span class="status-badge {status_class}">{status_label}</span>
-                        <h3>{_escape_html(scenario_title)}</h3>
-                        <span class="scenario-desc">
-                            {_escape_html(result.scenario.description)}
-                        </span>
-                    </div>
-                    <div class="scenario-stats">
-                        <span class="score">{result.score:.0%}</span>
-                        {llm_score_badge}
-                        <span class="turns">{result.turn_count} turns</span>
-                        {natural_indicator}
-                        <span class="toggle-icon">▼</span>
-                    </div>
-                </div>
-                <div class="scenario-details" id="details-{i}">
-                    {llm_eval_html}
-                    <div class="scenario-meta">
-                        <div class="meta-item">
-                            <strong>Persona:</strong> {result.scenario.persona}
-                        </div>
-                        <div class="meta-item">
-                            <strong>Initial Query:</strong>
-                            {_escape_html(result.scenario.initial_query)}
-                        </div>
-                        {_render_context_html(result.scenario.user_context)}
-                        {_render_goal_html(result.scenario.user_goal)}
-                    </div>
-                    {error_html}
-                    <div class="topics-section">
-                        <div class="topics-header">
-                            <h4>Expected Topics</h4>
-                            <div class="topics-legend">
-                                <span class="legend-item">
-                                    <span class="topic covered">Covered</span>
-                                </span>
-                                <span class="legend-item">
-                                    <span class="topic missing">Missing</span>
-                                </span>
-                            </div>
-                        </div>
-                        <div class="topics">
-                            {covered_html}
-                            {missing_html}
-                        </div>
-                    </div>
-                    <div class="conversation-section">
-                        <h4>Conversation Log</h4>
-                        <div class="conversation">
-                            {"".join(conversation_html)}
-                        </div>
-                    </div>
-                </div>
-            </div>
-        """)
-
-    # Generate full HTML
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{_escape_html(title)}</title>
-    <style>
-        :root {{
+# Static style and script blocks, defined once at import so each render
+# references them by pointer instead of re-copying ~15KB of literals.
+_DASHBOARD_CSS = """
+        :root {
             --pass-color: #10b981;
             --pass-bg: #d1fae5;
             --fail-color: #ef4444;
@@ -301,98 +126,98 @@ def generate_dashboard_html(
             --text-secondary: #6b7280;
             --bg-primary: #ffffff;
             --bg-secondary: #f9fafb;
-        }}
+        }
 
-        * {{
+        * {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto,
                 'Helvetica Neue', Arial, sans-serif;
             background-color: var(--bg-secondary);
             color: var(--text-primary);
             line-height: 1.6;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
 
-        header {{
+        header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px 20px;
             margin-bottom: 30px;
             border-radius: 12px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        header h1 {{
+        header h1 {
             font-size: 2rem;
             margin-bottom: 10px;
-        }}
+        }
 
-        .timestamp {{
+        .timestamp {
             opacity: 0.8;
             font-size: 0.9rem;
-        }}
+        }
 
-        .summary {{
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
 
-        .summary-card {{
+        .summary-card {
             background: var(--bg-primary);
             border-radius: 12px;
             padding: 20px;
             text-align: center;
             box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
             border: 1px solid var(--border-color);
-        }}
+        }
 
-        .summary-card.pass {{
+        .summary-card.pass {
             border-left: 4px solid var(--pass-color);
-        }}
+        }
 
-        .summary-card.fail {{
+        .summary-card.fail {
             border-left: 4px solid var(--fail-color);
-        }}
+        }
 
-        .summary-value {{
+        .summary-value {
             font-size: 2.5rem;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
+        }
 
-        .summary-card.pass .summary-value {{
+        .summary-card.pass .summary-value {
             color: var(--pass-color);
-        }}
+        }
 
-        .summary-card.fail .summary-value {{
+        .summary-card.fail .summary-value {
             color: var(--fail-color);
-        }}
+        }
 
-        .summary-label {{
+        .summary-label {
             color: var(--text-secondary);
             font-size: 0.9rem;
-        }}
+        }
 
-        .filter-bar {{
+        .filter-bar {
             display: flex;
             gap: 10px;
             margin-bottom: 20px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .filter-btn {{
+        .filter-btn {
             padding: 8px 16px;
             border: 1px solid var(--border-color);
             background: var(--bg-primary);
@@ -400,210 +225,210 @@ def generate_dashboard_html(
             cursor: pointer;
             font-size: 0.9rem;
             transition: all 0.2s;
-        }}
+        }
 
-        .filter-btn:hover {{
+        .filter-btn:hover {
             background: var(--bg-secondary);
-        }}
+        }
 
-        .filter-btn.active {{
+        .filter-btn.active {
             background: var(--text-primary);
             color: white;
             border-color: var(--text-primary);
-        }}
+        }
 
-        .scenario-card {{
+        .scenario-card {
             background: var(--bg-primary);
             border-radius: 12px;
             margin-bottom: 15px;
             box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
             border: 1px solid var(--border-color);
             overflow: hidden;
-        }}
+        }
 
-        .scenario-card.pass {{
+        .scenario-card.pass {
             border-left: 4px solid var(--pass-color);
-        }}
+        }
 
-        .scenario-card.fail {{
+        .scenario-card.fail {
             border-left: 4px solid var(--fail-color);
-        }}
+        }
 
-        .scenario-card.partial {{
+        .scenario-card.partial {
             border-left: 4px solid var(--partial-color);
-        }}
+        }
 
-        .scenario-header {{
+        .scenario-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             padding: 15px 20px;
             cursor: pointer;
             transition: background-color 0.2s;
-        }}
+        }
 
-        .scenario-header:hover {{
+        .scenario-header:hover {
             background-color: var(--bg-secondary);
-        }}
+        }
 
-        .scenario-title {{
+        .scenario-title {
             display: flex;
             align-items: center;
             gap: 12px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .scenario-title h3 {{
+        .scenario-title h3 {
             font-size: 1.1rem;
             font-weight: 600;
-        }}
+        }
 
-        .scenario-desc {{
+        .scenario-desc {
             color: var(--text-secondary);
             font-size: 0.9rem;
-        }}
+        }
 
-        .status-badge {{
+        .status-badge {
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 0.75rem;
             font-weight: bold;
             text-transform: uppercase;
-        }}
+        }
 
-        .status-badge.pass {{
+        .status-badge.pass {
             background: var(--pass-bg);
             color: var(--pass-color);
-        }}
+        }
 
-        .status-badge.fail {{
+        .status-badge.fail {
             background: var(--fail-bg);
             color: var(--fail-color);
-        }}
+        }
 
-        .status-badge.partial {{
+        .status-badge.partial {
             background: var(--partial-bg);
             color: var(--partial-color);
-        }}
+        }
 
-        .scenario-stats {{
+        .scenario-stats {
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
 
-        .score {{
+        .score {
             font-size: 1.5rem;
             font-weight: bold;
-        }}
+        }
 
-        .scenario-card.pass .score {{
+        .scenario-card.pass .score {
             color: var(--pass-color);
-        }}
+        }
 
-        .scenario-card.fail .score {{
+        .scenario-card.fail .score {
             color: var(--fail-color);
-        }}
+        }
 
-        .scenario-card.partial .score {{
+        .scenario-card.partial .score {
             color: var(--partial-color);
-        }}
+        }
 
-        .turns {{
+        .turns {
             color: var(--text-secondary);
             font-size: 0.9rem;
-        }}
+        }
 
-        .natural-end {{
+        .natural-end {
             background: #dbeafe;
             color: #3b82f6;
             padding: 2px 8px;
             border-radius: 10px;
             font-size: 0.75rem;
-        }}
+        }
 
-        .llm-score {{
+        .llm-score {
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 0.85rem;
             font-weight: bold;
-        }}
+        }
 
-        .llm-score.high {{
+        .llm-score.high {
             background: var(--pass-bg);
             color: var(--pass-color);
-        }}
+        }
 
-        .llm-score.medium {{
+        .llm-score.medium {
             background: var(--partial-bg);
             color: var(--partial-color);
-        }}
+        }
 
-        .llm-score.low {{
+        .llm-score.low {
             background: var(--fail-bg);
             color: var(--fail-color);
-        }}
+        }
 
-        .llm-evaluation-section {{
+        .llm-evaluation-section {
             margin-top: 20px;
             padding: 20px;
             background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
             border-radius: 12px;
             border: 1px solid var(--border-color);
-        }}
+        }
 
-        .llm-evaluation-section h4 {{
+        .llm-evaluation-section h4 {
             margin-bottom: 15px;
             color: var(--text-secondary);
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .llm-score-display {{
+        .llm-score-display {
             display: inline-flex;
             align-items: baseline;
             padding: 10px 20px;
             border-radius: 12px;
             margin-bottom: 15px;
-        }}
+        }
 
-        .llm-score-display.high {{
+        .llm-score-display.high {
             background: var(--pass-bg);
-        }}
+        }
 
-        .llm-score-display.medium {{
+        .llm-score-display.medium {
             background: var(--partial-bg);
-        }}
+        }
 
-        .llm-score-display.low {{
+        .llm-score-display.low {
             background: var(--fail-bg);
-        }}
+        }
 
-        .llm-score-value {{
+        .llm-score-value {
             font-size: 2rem;
             font-weight: bold;
-        }}
+        }
 
-        .llm-score-display.high .llm-score-value {{
+        .llm-score-display.high .llm-score-value {
             color: var(--pass-color);
-        }}
+        }
 
-        .llm-score-display.medium .llm-score-value {{
+        .llm-score-display.medium .llm-score-value {
             color: var(--partial-color);
-        }}
+        }
 
-        .llm-score-display.low .llm-score-value {{
+        .llm-score-display.low .llm-score-value {
             color: var(--fail-color);
-        }}
+        }
 
-        .llm-score-max {{
+        .llm-score-max {
             font-size: 1rem;
             color: var(--text-secondary);
             margin-left: 2px;
-        }}
+        }
 
-        .llm-comment {{
+        .llm-comment {
             font-size: 0.95rem;
             line-height: 1.7;
             color: var(--text-primary);
@@ -611,170 +436,170 @@ def generate_dashboard_html(
             background: var(--bg-primary);
             border-radius: 8px;
             border-left: 3px solid var(--agent-color);
-        }}
+        }
 
-        .toggle-icon {{
+        .toggle-icon {
             color: var(--text-secondary);
             transition: transform 0.3s;
-        }}
+        }
 
-        .scenario-card.expanded .toggle-icon {{
+        .scenario-card.expanded .toggle-icon {
             transform: rotate(180deg);
-        }}
+        }
 
-        .scenario-details {{
+        .scenario-details {
             display: none;
             padding: 0 20px 20px;
             border-top: 1px solid var(--border-color);
-        }}
+        }
 
-        .scenario-card.expanded .scenario-details {{
+        .scenario-card.expanded .scenario-details {
             display: block;
-        }}
+        }
 
-        .scenario-meta {{
+        .scenario-meta {
             background: var(--bg-secondary);
             padding: 15px;
             border-radius: 8px;
             margin: 15px 0;
-        }}
+        }
 
-        .meta-item {{
+        .meta-item {
             margin-bottom: 8px;
-        }}
+        }
 
-        .meta-item:last-child {{
+        .meta-item:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .meta-item strong {{
+        .meta-item strong {
             color: var(--text-secondary);
-        }}
+        }
 
-        .error-message {{
+        .error-message {
             background: var(--fail-bg);
             color: var(--fail-color);
             padding: 15px;
             border-radius: 8px;
             margin: 15px 0;
-        }}
+        }
 
-        .topics-section {{
+        .topics-section {
             margin: 20px 0;
-        }}
+        }
 
-        .topics-header {{
+        .topics-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 10px;
-        }}
+        }
 
-        .topics-section h4 {{
+        .topics-section h4 {
             margin: 0;
             color: var(--text-secondary);
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .topics {{
+        .topics {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
-        }}
+        }
 
-        .topic {{
+        .topic {
             padding: 4px 12px;
             border-radius: 15px;
             font-size: 0.85rem;
-        }}
+        }
 
-        .topic.covered {{
+        .topic.covered {
             background: var(--pass-bg);
             color: var(--pass-color);
-        }}
+        }
 
-        .topic.missing {{
+        .topic.missing {
             background: var(--fail-bg);
             color: var(--fail-color);
             text-decoration: line-through;
-        }}
+        }
 
-        .topics-legend {{
+        .topics-legend {
             display: flex;
             gap: 10px;
             font-size: 0.8rem;
             color: var(--text-secondary);
-        }}
+        }
 
-        .legend-item {{
+        .legend-item {
             margin-right: 15px;
-        }}
+        }
 
-        .conversation-section {{
+        .conversation-section {
             margin-top: 20px;
-        }}
+        }
 
-        .conversation-section h4 {{
+        .conversation-section h4 {
             margin-bottom: 15px;
             color: var(--text-secondary);
             font-size: 0.9rem;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .conversation {{
+        .conversation {
             display: flex;
             flex-direction: column;
             gap: 12px;
-        }}
+        }
 
-        .message {{
+        .message {
             padding: 12px 16px;
             border-radius: 12px;
             max-width: 85%;
-        }}
+        }
 
-        .message.user {{
+        .message.user {
             background: var(--user-bg);
             border-left: 3px solid var(--user-color);
             align-self: flex-start;
-        }}
+        }
 
-        .message.agent {{
+        .message.agent {
             background: var(--agent-bg);
             border-left: 3px solid var(--agent-color);
             align-self: flex-end;
-        }}
+        }
 
-        .message-header {{
+        .message-header {
             display: flex;
             justify-content: space-between;
             margin-bottom: 8px;
             font-size: 0.8rem;
-        }}
+        }
 
-        .message.user .role {{
+        .message.user .role {
             color: var(--user-color);
             font-weight: 600;
-        }}
+        }
 
-        .message.agent .role {{
+        .message.agent .role {
             color: var(--agent-color);
             font-weight: 600;
-        }}
+        }
 
-        .turn {{
+        .turn {
             color: var(--text-secondary);
-        }}
+        }
 
-        .message-content {{
+        .message-content {
             font-size: 0.95rem;
             line-height: 1.6;
-        }}
+        }
 
-        .tool-count {{
+        .tool-count {
             background: #e0e7ff;
             color: #4f46e5;
             padding: 2px 8px;
@@ -782,65 +607,65 @@ def generate_dashboard_html(
             font-size: 0.75rem;
             cursor: pointer;
             margin-left: 8px;
-        }}
+        }
 
-        .tool-count:hover {{
+        .tool-count:hover {
             background: #c7d2fe;
-        }}
+        }
 
-        .tool-uses {{
+        .tool-uses {
             background: #f8fafc;
             border-left: 3px solid #4f46e5;
             margin: 10px 0;
             padding: 12px;
             border-radius: 4px;
             display: none;
-        }}
+        }
 
-        .tool-uses.expanded {{
+        .tool-uses.expanded {
             display: block;
-        }}
+        }
 
-        .tool-use {{
+        .tool-use {
             margin-bottom: 12px;
             padding-bottom: 12px;
             border-bottom: 1px dashed #e2e8f0;
-        }}
+        }
 
-        .tool-use:last-child {{
+        .tool-use:last-child {
             margin-bottom: 0;
             padding-bottom: 0;
             border-bottom: none;
-        }}
+        }
 
-        .tool-header {{
+        .tool-header {
             display: flex;
             align-items: center;
             margin-bottom: 8px;
-        }}
+        }
 
-        .tool-name {{
+        .tool-name {
             font-weight: 600;
             color: #4f46e5;
             font-size: 0.9rem;
-        }}
+        }
 
-        .tool-detail {{
+        .tool-detail {
             font-size: 0.85rem;
-        }}
+        }
 
-        .tool-input, .tool-output {{
+        .tool-input, .tool-output {
             margin: 8px 0;
-        }}
+        }
 
-        .tool-input strong, .tool-output strong {{
+        .tool-input strong, .tool-output strong {
             display: block;
             color: var(--text-secondary);
             font-size: 0.8rem;
             margin-bottom: 4px;
-        }}
+        }
 
-        .tool-input pre, .tool-output pre {{
+        .tool-input pre, .tool-output pre {
             background: #f1f5f9;
             padding: 10px;
             border-radius: 4px;
@@ -851,15 +676,15 @@ def generate_dashboard_html(
             white-space: pre-wrap;
             word-wrap: break-word;
             margin: 0;
-        }}
+        }
 
-        .expand-all-bar {{
+        .expand-all-bar {
             display: flex;
             justify-content: flex-end;
             margin-bottom: 15px;
-        }}
+        }
 
-        .expand-all-btn {{
+        .expand-all-btn {
             padding: 8px 16px;
             background: var(--bg-primary);
             border: 1px solid var(--border-color);
@@ -867,80 +692,145 @@ def generate_dashboard_html(
             cursor: pointer;
             font-size: 0.9rem;
             transition: all 0.2s;
-        }}
+        }
 
-        .expand-all-btn:hover {{
+        .expand-all-btn:hover {
             background: var(--bg-secondary);
-        }}
+        }
 
-        footer {{
+        footer {
             text-align: center;
             padding: 20px;
             color: var(--text-secondary);
             font-size: 0.85rem;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            .scenario-header {{
+        @media (max-width: 768px) {
+            .scenario-header {
                 flex-direction: column;
                 align-items: flex-start;
                 gap: 10px;
-            }}
+            }
 
-            .scenario-stats {{
+            .scenario-stats {
                 width: 100%;
                 justify-content: flex-start;
-            }}
+            }
 
-            .message {{
+            .message {
                 max-width: 95%;
-            }}
-        }}
-    </style>
+            }
+        }
+    """
+
+_DASHBOARD_JS = """
+        function toggleScenario(index) {
+            const card = document.getElementById('scenario-' + index);
+            card.classList.toggle('expanded');
+        }
+
+        function filterScenarios(filter) {
+            const cards = document.querySelectorAll('.scenario-card');
+            const buttons = document.querySelectorAll('.filter-btn');
+
+            buttons.forEach(btn => btn.classList.remove('active'));
+            event.target.classList.add('active');
+
+            cards.forEach(card => {
+                if (filter === 'all') {
+                    card.style.display = 'block';
+                } else if (filter === 'pass') {
+                    card.style.display = card.classList.contains('pass')
+                        ? 'block' : 'none';
+                } else if (filter === 'fail') {
+                    card.style.display = (
+                        card.classList.contains('fail') ||
+                        card.classList.contains('partial')
+                    ) ? 'block' : 'none';
+                }
+            });
+        }
+
+        let allExpanded = false;
+        function toggleAll() {
+            const cards = document.querySelectorAll('.scenario-card');
+            allExpanded = !allExpanded;
+            cards.forEach(card => {
+                if (allExpanded) {
+                    card.classList.add('expanded');
+                } else {
+                    card.classList.remove('expanded');
+                }
+            });
+        }
+
+        function toggleTools(event, toolsId) {
+            event.stopPropagation();
+            const toolsDiv = document.getElementById(toolsId);
+            if (toolsDiv) {
+                toolsDiv.classList.toggle('expanded');
+            }
+        }
+    """
+
+# Page head, split around the static CSS block so per-render formatting
+# touches only the small dynamic pieces. %-formatting with named
+# placeholders copies the literal portions in one pass; the ~15KB CSS
+# (which contains literal "%" characters) is written verbatim, never
+# scanned for placeholders.
+_PAGE_HEAD_PRE_CSS = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>%(title)s</title>
+    <style>"""
+
+_PAGE_HEAD_POST_CSS = """</style>
 </head>
 <body>
     <div class="container">
         <header>
-            <h1>{_escape_html(title)}</h1>
-            <div class="timestamp">Generated: {timestamp}</div>
+            <h1>%(title)s</h1>
+            <div class="timestamp">Generated: %(timestamp)s</div>
         </header>
 
         <div class="summary">
             <div class="summary-card">
-                <div class="summary-value">{total}</div>
+                <div class="summary-value">%(total)s</div>
                 <div class="summary-label">Total Scenarios</div>
             </div>
             <div class="summary-card pass">
-                <div class="summary-value">{passed}</div>
+                <div class="summary-value">%(passed)s</div>
                 <div class="summary-label">Passed</div>
             </div>
             <div class="summary-card fail">
-                <div class="summary-value">{failed}</div>
+                <div class="summary-value">%(failed)s</div>
                 <div class="summary-label">Failed</div>
             </div>
             <div class="summary-card">
-                <div class="summary-value">{avg_score:.0%}</div>
+                <div class="summary-value">%(avg_score)s</div>
                 <div class="summary-label">Avg Score</div>
             </div>
             <div class="summary-card">
-                <div class="summary-value">{avg_turns:.1f}</div>
+                <div class="summary-value">%(avg_turns)s</div>
                 <div class="summary-label">Avg Turns</div>
             </div>
             <div class="summary-card">
-                <div class="summary-value">{natural_ends}</div>
+                <div class="summary-value">%(natural_ends)s</div>
                 <div class="summary-label">Natural Ends</div>
             </div>
         </div>
 
         <div class="filter-bar">
             <button class="filter-btn active" onclick="filterScenarios('all')">
-                All ({total})
+                All (%(total)s)
             </button>
             <button class="filter-btn" onclick="filterScenarios('pass')">
-                Passed ({passed})
+                Passed (%(passed)s)
             </button>
             <button class="filter-btn" onclick="filterScenarios('fail')">
-                Failed ({failed})
+                Failed (%(failed)s)
             </button>
         </div>
 
@@ -951,7 +841,11 @@ def generate_dashboard_html(
         </div>
 
         <div class="scenarios" id="scenarios">
-            {"".join(scenario_cards)}
+            """
+
+# Static page tail: no placeholders, written as-is after the cards
+_PAGE_TAIL = (
+    """
         </div>
 
         <footer>
@@ -959,60 +853,480 @@ def generate_dashboard_html(
         </footer>
     </div>
 
-    <script>
-        function toggleScenario(index) {{
-            const card = document.getElementById('scenario-' + index);
-            card.classList.toggle('expanded');
-        }}
+    <script>"""
+    + _DASHBOARD_JS
+    + """</script>
+</body>
+</html>
+"""
+)
 
-        function filterScenarios(filter) {{
-            const cards = document.querySelectorAll('.scenario-card');
-            const buttons = document.querySelectorAll('.filter-btn');
 
-            buttons.forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
+# Static legend/header block reused by every scenario card
+_TOPICS_HEADER_HTML = """
+                    <div class="topics-section">
+                        <div class="topics-header">
+                            <h4>Expected Topics</h4>
+                            <div class="topics-legend">
+                                <span class="legend-item">
+                                    <span class="topic covered">Covered</span>
+                                </span>
+                                <span class="legend-item">
+                                    <span class="topic missing">Missing</span>
+                                </span>
+                            </div>
+                        </div>
+                        <div class="topics">
+"""
 
-            cards.forEach(card => {{
-                if (filter === 'all') {{
-                    card.style.display = 'block';
-                }} else if (filter === 'pass') {{
-                    card.style.display = card.classList.contains('pass')
-                        ? 'block' : 'none';
-                }} else if (filter === 'fail') {{
-                    card.style.display = (
-                        card.classList.contains('fail') ||
-                        card.classList.contains('partial')
-                    ) ? 'block' : 'none';
-                }}
-            }});
-        }}
 
-        let allExpanded = false;
-        function toggleAll() {{
-            const cards = document.querySelectorAll('.scenario-card');
-            allExpanded = !allExpanded;
-            cards.forEach(card => {{
-                if (allExpanded) {{
-                    card.classList.add('expanded');
-                }} else {{
-                    card.classList.remove('expanded');
-                }}
-            }});
-        }}
+def _render_conversation(
+    write: Callable[[str], object],
+    index: int,
+    result: EvaluationResult,
+    json_cache: dict[int, str],
+) -> None:
+    """Write the conversation log fragments for a scenario card.
 
-        function toggleTools(event, toolsId) {{
-            event.stopPropagation();
-            const toolsDiv = document.getElementById(toolsId);
-            if (toolsDiv) {{
-                toolsDiv.classList.toggle('expanded');
-            }}
-        }}
-    </script>
-</body>
-</html>
-"""
+    Args:
+        write: Sink for HTML fragments (e.g. StringIO.write). Fragments
+            go to a growable buffer, so no intermediate strings are
+            concatenated.
+        index: Scenario card index (used for element ids).
+        result: The evaluation result being rendered.
+        json_cache: Per-render memo of escaped, serialized tool inputs
+            keyed by dict identity. Repeated tool calls with the same
+            input dict serialize and escape once per dashboard render.
+    """
+    # Local bindings: LOAD_FAST beats LOAD_GLOBAL (+ LOAD_ATTR for
+    # json.dumps) on the many calls made across turns and tool uses.
+    escape = _escape_html
+    dumps = json.dumps
+    format_message = _format_message_html
+
+    tool_use_counter = 0
+    for turn in result.conversation.turns:
+        # Hoist per-turn attribute reads to locals: each is a LOAD_ATTR
+        # the interpreter cannot eliminate on its own.
+        role = turn.role
+        message = turn.message
+        turn_number = turn.turn_number
+        tool_uses = turn.tool_uses
+
+        if role == "user":
+            role_class = "user"
+            role_label = "User"
+        else:
+            role_class = "agent"
+            role_label = "Agent"
+
+        write(f'\n                <div class="message {role_class}">')
+        write('\n                    <div class="message-header">')
+        write(f'\n                        <span class="role">{role_label}</span>')
+        write(f'\n                        <span class="turn">Turn {turn_number}</span>')
+
+        if tool_uses:
+            tool_count = len(tool_uses)
+            plural = "s" if tool_count > 1 else ""
+            write(
+                f'\n                        <span class="tool-count" '
+                f"onclick=\"toggleTools(event, 'tools-{index}-{tool_use_counter}')\">"
+                f"🔧 {tool_count} tool{plural}</span>"
+            )
+        write("\n                    </div>")
+
+        if tool_uses:
+            write(
+                f'\n                    <div class="tool-uses" '
+                f'id="tools-{index}-{tool_use_counter}">'
+            )
+            for tu in tool_uses:
+                write(
+                    '\n                        <div class="tool-use">'
+                    '\n                            <div class="tool-header">'
+                    '\n                                <span class="tool-name">'
+                )
+                write(escape(tu.tool_name))
+                write(
+                    "</span>"
+                    "\n                            </div>"
+                    '\n                            <div class="tool-detail">'
+                    '\n                                <div class="tool-input">'
+                    "\n                                    <strong>Input:</strong>"
+                    "\n                                    <pre>"
+                )
+                key = id(tu.tool_input)
+                serialized = json_cache.get(key)
+                if serialized is None:
+                    serialized = escape(
+                        dumps(tu.tool_input, ensure_ascii=False, indent=2)
+                    )
+                    json_cache[key] = serialized
+                write(serialized)
+                write(
+                    "</pre>"
+                    "\n                                </div>"
+                    '\n                                <div class="tool-output">'
+                    "\n                                    <strong>Output:</strong>"
+                    "\n                                    <pre>"
+                )
+                write(escape(tu.tool_output))
+                write(
+                    "</pre>"
+                    "\n                                </div>"
+                    "\n                            </div>"
+                    "\n                        </div>"
+                )
+            write("\n                    </div>")
+            tool_use_counter += 1
+
+        write('\n                    <div class="message-content">')
+        write(format_message(message))
+        write("</div>\n                </div>\n")
+
+
+@dataclass(slots=True)
+class _ScenarioView:
+    """Precomputed, render-ready fields for one scenario card.
+
+    Built in a first pass that performs all the attribute traversal and
+    escaping, so the pass that writes the document is almost pure string
+    work over a flat object.
+
+    Attributes:
+        index: Scenario card index (used for element ids).
+        status_class: CSS class for the pass/partial/fail state.
+        status_label: Display label for the pass/partial/fail state.
+        title_html: Escaped card title (with scenario number if present).
+        desc_html: Escaped scenario description.
+        score_pct: Score preformatted as a percentage string.
+        turn_count: Number of conversation turns.
+        natural_end: Whether the conversation ended naturally.
+        llm_score: LLM evaluation score, or None when not evaluated.
+        llm_score_class: CSS class for the LLM score badge.
+        llm_comment_html: Formatted LLM evaluation comment.
+        persona: Scenario persona name.
+        initial_query_html: Escaped initial query.
+        context_html: Rendered user-context meta item (may be empty).
+        goal_html: Rendered user-goal meta item (may be empty).
+        error_html: Escaped conversation error (empty when no error).
+        topics_html: Concatenated covered/missing topic badges.
+        result: The underlying result; the conversation log is streamed
+            from it directly rather than precomputed, since it is by far
+            the largest part of the card.
+    """
+
+    index: int
+    status_class: str
+    status_label: str
+    title_html: str
+    desc_html: str
+    score_pct: str
+    turn_count: int
+    natural_end: bool
+    llm_score: int | None
+    llm_score_class: str
+    llm_comment_html: str
+    persona: str
+    initial_query_html: str
+    context_html: str
+    goal_html: str
+    error_html: str
+    topics_html: str
+    result: EvaluationResult
+
+
+def _build_scenario_view(index: int, result: EvaluationResult) -> _ScenarioView:
+    """Extract and preformat everything a scenario card needs.
+
+    Args:
+        index: Scenario card index.
+        result: The evaluation result to extract from.
+
+    Returns:
+        A render-ready view of the result.
+    """
+    escape = _escape_html
+
+    status_class, status_label = _get_status(result.score)
+    scenario = result.scenario
+
+    llm_score: int | None = None
+    llm_score_class = ""
+    llm_comment_html = ""
+    if result.llm_evaluation:
+        llm_score = result.llm_evaluation.score
+        llm_score_class = _LLM_SCORE_CLASSES[min(llm_score, 5)]
+        llm_comment_html = _format_message_html(result.llm_evaluation.comment)
+
+    scenario_title = (
+        f"#{scenario.scenario_number} {scenario.name}"
+        if scenario.scenario_number is not None
+        else scenario.name
+    )
+
+    topic_parts: list[str] = []
+    for topic in result.topics_covered:
+        topic_parts.append('<span class="topic covered">' + escape(topic) + "</span>")
+    for topic in result.topics_missing:
+        topic_parts.append('<span class="topic missing">' + escape(topic) + "</span>")
+
+    return _ScenarioView(
+        index=index,
+        status_class=status_class,
+        status_label=status_label,
+        title_html=escape(scenario_title),
+        desc_html=escape(scenario.description),
+        score_pct=_fmt_pct(result.score),
+        turn_count=result.turn_count,
+        natural_end=result.conversation.natural_end,
+        llm_score=llm_score,
+        llm_score_class=llm_score_class,
+        llm_comment_html=llm_comment_html,
+        persona=scenario.persona,
+        initial_query_html=escape(scenario.initial_query),
+        context_html=_render_context_html(scenario.user_context),
+        goal_html=_render_goal_html(scenario.user_goal),
+        error_html=escape(result.conversation.error)
+        if result.conversation.error
+        else "",
+        topics_html="".join(topic_parts),
+        result=result,
+    )
+
+
+def _render_scenario_card(
+    write: Callable[[str], object],
+    view: _ScenarioView,
+    json_cache: dict[int, str],
+) -> None:
+    """Write the HTML fragments for one scenario card.
+
+    Fragments go straight to the output buffer, so no intermediate
+    per-card or per-turn strings are materialized.
+
+    Args:
+        write: Sink for HTML fragments (e.g. StringIO.write).
+        view: Precomputed view of the scenario result.
+        json_cache: Per-render memo for serialized tool inputs; see
+            _render_conversation.
+    """
+    index = view.index
+    status_class = view.status_class
+
+    llm_score_badge = (
+        f'<span class="llm-score {view.llm_score_class}">{view.llm_score}/5</span>'
+        if view.llm_score is not None
+        else ""
+    )
+
+    # Card header
+    write(
+        f'\n            <div class="scenario-card {status_class}" '
+        f'id="scenario-{index}">'
+        f'\n                <div class="scenario-header" '
+        f'onclick="toggleScenario({index})">'
+        '\n                    <div class="scenario-title">'
+        f'\n                        <span class="status-badge {status_class}">'
+        f"{view.status_label}</span>\n                        <h3>"
+    )
+    write(view.title_html)
+    write('</h3>\n                        <span class="scenario-desc">')
+    write(view.desc_html)
+    write(
+        "</span>\n                    </div>"
+        '\n                    <div class="scenario-stats">'
+        f'\n                        <span class="score">{view.score_pct}</span>'
+        f"\n                        {llm_score_badge}"
+        f'\n                        <span class="turns">{view.turn_count} '
+        "turns</span>"
+    )
+    if view.natural_end:
+        write('\n                        <span class="natural-end">Natural End</span>')
+    write(
+        '\n                        <span class="toggle-icon">▼</span>'
+        "\n                    </div>\n                </div>"
+        f'\n                <div class="scenario-details" id="details-{index}">'
+    )
+
+    # LLM evaluation section
+    if view.llm_score is not None:
+        write(
+            '\n                <div class="llm-evaluation-section">'
+            "\n                    <h4>LLM Evaluation</h4>"
+            f'\n                    <div class="llm-score-display '
+            f'{view.llm_score_class}">'
+            f'\n                        <span class="llm-score-value">'
+            f"{view.llm_score}</span>"
+            '\n                        <span class="llm-score-max">/5</span>'
+            "\n                    </div>"
+            '\n                    <div class="llm-comment">\n                        '
+        )
+        write(view.llm_comment_html)
+        write("\n                    </div>\n                </div>")
+
+    # Scenario metadata
+    write(
+        '\n                    <div class="scenario-meta">'
+        '\n                        <div class="meta-item">'
+        f"\n                            <strong>Persona:</strong> "
+        f"{view.persona}\n                        </div>"
+        '\n                        <div class="meta-item">'
+        "\n                            <strong>Initial Query:</strong>"
+        "\n                            "
+    )
+    write(view.initial_query_html)
+    write("\n                        </div>\n                        ")
+    write(view.context_html)
+    write("\n                        ")
+    write(view.goal_html)
+    write("\n                    </div>")
+
+    # Error message if any
+    if view.error_html:
+        write(
+            '\n                <div class="error-message">'
+            "\n                    <strong>Error:</strong> "
+        )
+        write(view.error_html)
+        write("\n                </div>")
+
+    # Topics
+    write(_TOPICS_HEADER_HTML)
+    write(view.topics_html)
+    write("\n                        </div>\n                    </div>")
+
+    # Conversation log
+    write(
+        '\n                    <div class="conversation-section">'
+        "\n                        <h4>Conversation Log</h4>"
+        '\n                        <div class="conversation">'
+    )
+    _render_conversation(write, index, view.result, json_cache)
+    write(
+        "\n                        </div>\n                    </div>"
+        "\n                </div>\n            </div>\n        "
+    )
+
+
+def iter_dashboard_html(
+    results: list[EvaluationResult],
+    title: str = "Agent Evaluation Dashboard",
+) -> Iterator[str]:
+    """Yield the dashboard HTML in chunks: head, one per card, tail.
+
+    The first chunks are available before any scenario is rendered, so a
+    consumer (e.g. a chunked HTTP response) can start delivering bytes
+    immediately instead of waiting for the whole document.
+
+    Args:
+        results: List of evaluation results.
+        title: Dashboard title.
+
+    Yields:
+        HTML chunks, in document order.
+    """
+    # Sort results by scenario_number (ascending), placing None values at
+    # the end. Keys are precomputed once per element (None -> +inf) and
+    # sorted with itemgetter, avoiding a lambda call per comparison; ties
+    # keep their original order via the index component.
+    inf = float("inf")
+    keyed = [
+        (
+            r.scenario.scenario_number
+            if r.scenario.scenario_number is not None
+            else inf,
+            i,
+            r,
+        )
+        for i, r in enumerate(results)
+    ]
+    keyed.sort(key=itemgetter(0, 1))
+    sorted_results = [item[2] for item in keyed]
+
+    # Calculate summary statistics in a single pass over the results
+    total = len(results)
+    passed = 0
+    score_sum = 0.0
+    turn_sum = 0
+    natural_ends = 0
+    for r in results:
+        if r.score >= PASS_THRESHOLD:
+            passed += 1
+        score_sum += r.score
+        turn_sum += r.turn_count
+        if r.conversation.natural_end:
+            natural_ends += 1
+    failed = total - passed
+    avg_score = score_sum / total if total > 0 else 0
+    avg_turns = turn_sum / total if total > 0 else 0
+
+    head_values = {
+        "title": _escape_html(title),
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "total": total,
+        "passed": passed,
+        "failed": failed,
+        "avg_score": _fmt_pct(avg_score),
+        "avg_turns": _fmt_f1(avg_turns),
+        "natural_ends": natural_ends,
+    }
+    yield _PAGE_HEAD_PRE_CSS % head_values
+    yield _DASHBOARD_CSS
+    yield _PAGE_HEAD_POST_CSS % head_values
+
+    # One chunk per card: extract/escape into a view, render into a
+    # reused buffer, yield. json_cache lives for a single render: tool
+    # inputs are not mutated while rendering, so identity-keyed
+    # memoization is safe here.
+    buf = io.StringIO()
+    write = buf.write
+    json_cache: dict[int, str] = {}
+    for i, result in enumerate(sorted_results):
+        view = _build_scenario_view(i, result)
+        buf.seek(0)
+        buf.truncate()
+        _render_scenario_card(write, view, json_cache)
+        yield buf.getvalue()
+
+    yield _PAGE_TAIL
 
-    return html_content
+
+def write_dashboard_html(
+    results: list[EvaluationResult],
+    out: TextIO,
+    title: str = "Agent Evaluation Dashboard",
+) -> None:
+    """Write the HTML dashboard for evaluation results to a text sink.
+
+    Chunks are written as they are produced, so when `out` is a file the
+    full document is never held in memory and disk I/O overlaps with
+    rendering.
+
+    Args:
+        results: List of evaluation results.
+        out: Writable text sink (file handle or StringIO).
+        title: Dashboard title.
+    """
+    write = out.write
+    for chunk in iter_dashboard_html(results, title):
+        write(chunk)
+
+
+def generate_dashboard_html(
+    results: list[EvaluationResult],
+    title: str = "Agent Evaluation Dashboard",
+) -> str:
+    """Generate HTML dashboard for evaluation results.
+
+    Args:
+        results: List of evaluation results.
+        title: Dashboard title.
+
+    Returns:
+        HTML string for the dashboard.
+    """
+    return "".join(iter_dashboard_html(results, title))
 
 
 def save_dashboard(
@@ -1022,6 +1336,11 @@ def save_dashboard(
 ) -> Path:
     """Generate and save HTML dashboard.
 
+    Streams the document straight to the file instead of materializing
+    it as one string first. The file is opened in binary mode and each
+    chunk is UTF-8 encoded exactly once on the way in, bypassing the
+    text-layer wrapper; the large buffer keeps write syscalls down.
+
     Args:
         results: List of evaluation results.
         output_path: Path to save the HTML file.
@@ -1031,98 +1350,185 @@ def save_dashboard(
         Path to the saved HTML file.
     """
     output_path = Path(output_path)
-    html_content = generate_dashboard_html(results, title)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        write = f.write
+        for chunk in iter_dashboard_html(results, title):
+            write(chunk.encode("utf-8"))
 
     return output_path
 
 
+def save_all(
+    results: list[EvaluationResult],
+    output_dir: Path | str,
+    timestamp: str | None = None,
+    title: str = "Agent Evaluation Dashboard",
+) -> tuple[Path, Path]:
+    """Save the HTML dashboard and results JSON for one run back-to-back.
+
+    Callers that want both artifacts previously walked the results twice
+    through two separate save calls; this writes them in one pass over
+    warm data, with the file opens/closes amortized into a single spot.
+
+    Args:
+        results: List of evaluation results.
+        output_dir: Directory to write into (created if missing).
+        timestamp: Timestamp string used in the filenames. Defaults to
+            the current time formatted as ``%Y%m%d_%H%M%S``.
+        title: Dashboard title.
+
+    Returns:
+        Tuple of (dashboard HTML path, results JSON path).
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # One clock read stamps both the filenames and the JSON payload
+    now = datetime.now()
+    if timestamp is None:
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    dashboard_path = save_dashboard(
+        results, output_dir / f"dashboard_{timestamp}.html", title
+    )
+    json_path = save_results_json(
+        results,
+        output_dir / f"results_{timestamp}.json",
+        generated_at=now.isoformat(),
+    )
+
+    return dashboard_path, json_path
+
+
+def _result_json_default(obj: object) -> dict[str, object]:
+    """Convert evaluation dataclasses to JSON-ready dicts during encoding.
+
+    Used as the encoder's `default` hook so per-result dicts are built
+    lazily while the encoder walks the tree, instead of materializing
+    the whole nested structure up front. Nested dataclass values (turns,
+    tool uses) are returned as-is and converted when the encoder reaches
+    them.
+
+    Args:
+        obj: The object the encoder could not serialize natively.
+
+    Returns:
+        A JSON-serializable dict for the known result types.
+
+    Raises:
+        TypeError: If obj is not one of the evaluation dataclasses.
+    """
+    if isinstance(obj, EvaluationResult):
+        return {
+            "scenario": {
+                "name": obj.scenario.name,
+                "description": obj.scenario.description,
+                "initial_query": obj.scenario.initial_query,
+                "expected_topics": obj.scenario.expected_topics,
+                "persona": obj.scenario.persona,
+                "max_turns": obj.scenario.max_turns,
+                "user_context": obj.scenario.user_context,
+                "user_goal": obj.scenario.user_goal,
+                "scenario_number": obj.scenario.scenario_number,
+            },
+            "score": obj.score,
+            "turn_count": obj.turn_count,
+            "topics_covered": obj.topics_covered,
+            "topics_missing": obj.topics_missing,
+            "natural_end": obj.conversation.natural_end,
+            "error": obj.conversation.error,
+            "llm_evaluation": (
+                {
+                    "score": obj.llm_evaluation.score,
+                    "comment": obj.llm_evaluation.comment,
+                }
+                if obj.llm_evaluation
+                else None
+            ),
+            "conversation": obj.conversation.turns,
+        }
+    if isinstance(obj, ConversationTurn):
+        return {
+            "role": obj.role,
+            "turn_number": obj.turn_number,
+            "message": obj.message,
+            "tool_uses": obj.tool_uses,
+        }
+    if isinstance(obj, ToolUsage):
+        return {
+            "tool_name": obj.tool_name,
+            "tool_input": obj.tool_input,
+            "tool_output": obj.tool_output,
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_results_json(
     results: list[EvaluationResult],
     output_path: Path | str,
+    indent: int | None = None,
+    generated_at: str | None = None,
 ) -> Path:
     """Save evaluation results as JSON for later analysis.
 
     Args:
         results: List of evaluation results.
         output_path: Path to save the JSON file.
+        indent: Indentation level for pretty-printing. None (the
+            default) writes compact JSON, which encodes roughly twice as
+            fast and halves the file size; pass 2 for human-readable
+            output.
+        generated_at: ISO timestamp recorded in the payload. Batch
+            drivers saving several artifacts can pass one shared stamp
+            instead of reading the clock per file. Defaults to now.
 
     Returns:
         Path to the saved JSON file.
     """
     output_path = Path(output_path)
 
-    # Calculate average LLM score
-    llm_scores = [
-        r.llm_evaluation.score for r in results if r.llm_evaluation is not None
-    ]
-    avg_llm_score = sum(llm_scores) / len(llm_scores) if llm_scores else None
+    if generated_at is None:
+        generated_at = datetime.now().isoformat()
+
+    # Aggregate all summary statistics in one pass over the results
+    total = len(results)
+    passed = 0
+    score_sum = 0.0
+    turn_sum = 0
+    llm_sum = 0
+    llm_count = 0
+    for r in results:
+        if r.score >= PASS_THRESHOLD:
+            passed += 1
+        score_sum += r.score
+        turn_sum += r.turn_count
+        if r.llm_evaluation is not None:
+            llm_sum += r.llm_evaluation.score
+            llm_count += 1
 
     data = {
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at,
         "summary": {
-            "total": len(results),
-            "passed": sum(1 for r in results if r.score >= PASS_THRESHOLD),
-            "failed": sum(1 for r in results if r.score < PASS_THRESHOLD),
-            "average_score": (
-                sum(r.score for r in results) / len(results) if results else 0
-            ),
-            "average_turns": (
-                sum(r.turn_count for r in results) / len(results) if results else 0
-            ),
-            "average_llm_score": avg_llm_score,
+            "total": total,
+            "passed": passed,
+            "failed": total - passed,
+            "average_score": score_sum / total if results else 0,
+            "average_turns": turn_sum / total if results else 0,
+            "average_llm_score": llm_sum / llm_count if llm_count else None,
         },
-        "results": [
-            {
-                "scenario": {
-                    "name": r.scenario.name,
-                    "description": r.scenario.description,
-                    "initial_query": r.scenario.initial_query,
-                    "expected_topics": r.scenario.expected_topics,
-                    "persona": r.scenario.persona,
-                    "max_turns": r.scenario.max_turns,
-                    "user_context": r.scenario.user_context,
-                    "user_goal": r.scenario.user_goal,
-                    "scenario_number": r.scenario.scenario_number,
-                },
-                "score": r.score,
-                "turn_count": r.turn_count,
-                "topics_covered": r.topics_covered,
-                "topics_missing": r.topics_missing,
-                "natural_end": r.conversation.natural_end,
-                "error": r.conversation.error,
-                "llm_evaluation": (
-                    {
-                        "score": r.llm_evaluation.score,
-                        "comment": r.llm_evaluation.comment,
-                    }
-                    if r.llm_evaluation
-                    else None
-                ),
-                "conversation": [
-                    {
-                        "role": t.role,
-                        "turn_number": t.turn_number,
-                        "message": t.message,
-                        "tool_uses": [
-                            {
-                                "tool_name": tu.tool_name,
-                                "tool_input": tu.tool_input,
-                                "tool_output": tu.tool_output,
-                            }
-                            for tu in t.tool_uses
-                        ],
-                    }
-                    for t in r.conversation.turns
-                ],
-            }
-            for r in results
-        ],
+        "results": results,
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # iterencode + the default hook serialize one result at a time, so
+    # peak memory stays at one result's dicts rather than the whole tree
+    # plus its serialized text; the large write buffer batches the many
+    # small encoder chunks into few syscalls.
+    encoder = json.JSONEncoder(
+        ensure_ascii=False, indent=indent, default=_result_json_default
+    )
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for chunk in encoder.iterencode(data):
+            f.write(chunk)
 
     return output_path
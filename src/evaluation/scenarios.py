@@ -2,20 +2,37 @@
 
 import json
 import logging
+import sys
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 
+try:
+    # orjson parses JSON noticeably faster than the stdlib; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catching the stdlib exception keep working either way.
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Valid persona values
-VALID_PERSONAS = {"polite", "frustrated", "confused", "detailed", "curt"}
+VALID_PERSONAS = frozenset({"polite", "frustrated", "confused", "detailed", "curt"})
+
+# Sorted once for error messages, instead of per failing scenario
+_VALID_PERSONAS_SORTED = tuple(sorted(VALID_PERSONAS))
 
 # Validation constants
 MIN_MAX_TURNS = 1
 MAX_MAX_TURNS = 20
 
+# Fields every scenario entry must define, hoisted so the validation
+# loop does not rebuild the list per scenario
+_REQUIRED_SCENARIO_FIELDS = ("name", "description", "initial_query", "expected_topics")
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationFlowStep:
     """A single step in a predefined conversation flow.
 
@@ -31,7 +48,7 @@ class ConversationFlowStep:
     user_response_hint: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationScenario:
     """A scenario for evaluating the customer support agent.
 
@@ -62,7 +79,7 @@ class EvaluationScenario:
     scenario_number: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioSet:
     """A set of evaluation scenarios loaded from a JSON file.
 
@@ -79,11 +96,20 @@ class ScenarioSet:
     source_file: Path | None = None
 
 
-def load_scenarios_from_json(json_path: Path | str) -> ScenarioSet:
+def load_scenarios_from_json(
+    json_path: Path | str, filter_name: str | None = None
+) -> ScenarioSet:
     """Load evaluation scenarios from a JSON file.
 
+    Results are cached per (path, mtime, size), so loading the same
+    unchanged file again within one process (e.g. --list-scenarios
+    followed by a run) returns the already-parsed ScenarioSet.
+
     Args:
         json_path: Path to the JSON file containing scenarios.
+        filter_name: If given, only the scenario with this name is
+            validated and constructed; other entries are skipped before
+            any per-scenario work.
 
     Returns:
         ScenarioSet containing all loaded scenarios.
@@ -94,9 +120,36 @@ def load_scenarios_from_json(json_path: Path | str) -> ScenarioSet:
         ValueError: If the JSON structure is invalid.
     """
     json_path = Path(json_path)
+    stat = json_path.stat()
+    return _load_scenarios_cached(
+        str(json_path), stat.st_mtime_ns, stat.st_size, filter_name
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_scenarios_cached(
+    path_str: str, mtime_ns: int, size: int, filter_name: str | None = None
+) -> ScenarioSet:
+    """Parse and validate a scenario file, cached on (path, mtime, size).
 
-    with open(json_path, encoding="utf-8") as f:
-        data = json.load(f)
+    The mtime/size arguments exist only to key the cache: an edited file
+    gets a fresh parse, an unchanged one is served from memory.
+
+    Args:
+        path_str: Path to the JSON file as a string.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        ScenarioSet containing all loaded scenarios.
+    """
+    json_path = Path(path_str)
+
+    if orjson is not None:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
 
     # Validate required fields
     if "version" not in data:
@@ -104,71 +157,15 @@ def load_scenarios_from_json(json_path: Path | str) -> ScenarioSet:
     if "scenarios" not in data:
         raise ValueError("JSON must contain 'scenarios' array")
 
-    scenarios: list[EvaluationScenario] = []
-
-    for i, scenario_data in enumerate(data["scenarios"]):
-        # Validate required fields for each scenario
-        required_fields = ["name", "description", "initial_query", "expected_topics"]
-        for field_name in required_fields:
-            if field_name not in scenario_data:
-                raise ValueError(f"Scenario {i} missing required field '{field_name}'")
-
-        # Validate max_turns
-        max_turns = scenario_data.get("max_turns", 3)
-        if not isinstance(max_turns, int) or max_turns < MIN_MAX_TURNS:
-            raise ValueError(
-                f"Scenario {i} ({scenario_data['name']}): "
-                f"max_turns must be a positive integer, got {max_turns}"
-            )
-        if max_turns > MAX_MAX_TURNS:
-            logger.warning(
-                f"Scenario {i} ({scenario_data['name']}): "
-                f"max_turns={max_turns} is unusually high "
-                f"(max recommended: {MAX_MAX_TURNS})"
-            )
-
-        # Validate persona
-        persona = scenario_data.get("persona", "polite")
-        if persona not in VALID_PERSONAS:
-            raise ValueError(
-                f"Scenario {i} ({scenario_data['name']}): "
-                f"invalid persona '{persona}'. Must be one of: {sorted(VALID_PERSONAS)}"
-            )
-
-        # Validate expected_topics is non-empty
-        expected_topics = scenario_data["expected_topics"]
-        if not isinstance(expected_topics, list) or len(expected_topics) == 0:
-            raise ValueError(
-                f"Scenario {i} ({scenario_data['name']}): "
-                "expected_topics must be a non-empty list"
-            )
-
-        # Parse conversation flow if present
-        conversation_flow = None
-        if scenario_data.get("conversation_flow"):
-            conversation_flow = [
-                ConversationFlowStep(
-                    turn=step["turn"],
-                    expected_agent_action=step["expected_agent_action"],
-                    user_response_hint=step.get("user_response_hint"),
-                )
-                for step in scenario_data["conversation_flow"]
-            ]
-
-        scenario = EvaluationScenario(
-            name=scenario_data["name"],
-            description=scenario_data["description"],
-            initial_query=scenario_data["initial_query"],
-            expected_topics=scenario_data["expected_topics"],
-            expected_tool_use=scenario_data.get("expected_tool_use", True),
-            persona=scenario_data.get("persona", "polite"),
-            max_turns=scenario_data.get("max_turns", 3),
-            user_context=scenario_data.get("user_context", ""),
-            user_goal=scenario_data.get("user_goal", ""),
-            conversation_flow=conversation_flow,
-            scenario_number=scenario_data.get("scenario_number"),
-        )
-        scenarios.append(scenario)
+    # Comprehension over a helper: no per-iteration .append method
+    # lookup, and the per-scenario validation (with its indexed error
+    # messages) stays in one place. With a filter, non-matching entries
+    # are skipped before any validation or construction.
+    scenarios = [
+        _parse_scenario(i, scenario_data)
+        for i, scenario_data in enumerate(data["scenarios"])
+        if filter_name is None or scenario_data.get("name") == filter_name
+    ]
 
     return ScenarioSet(
         version=data["version"],
@@ -178,9 +175,103 @@ def load_scenarios_from_json(json_path: Path | str) -> ScenarioSet:
     )
 
 
+def _parse_scenario(i: int, scenario_data: dict) -> EvaluationScenario:
+    """Validate and build a single scenario entry.
+
+    Args:
+        i: Index of the entry in the scenarios array, used in error
+            messages.
+        scenario_data: The raw scenario dict from JSON.
+
+    Returns:
+        The constructed EvaluationScenario.
+
+    Raises:
+        ValueError: If the entry fails validation.
+    """
+    # Validate required fields for each scenario
+    for field_name in _REQUIRED_SCENARIO_FIELDS:
+        if field_name not in scenario_data:
+            raise ValueError(f"Scenario {i} missing required field '{field_name}'")
+
+    # Validate max_turns
+    max_turns = scenario_data.get("max_turns", 3)
+    if not isinstance(max_turns, int) or max_turns < MIN_MAX_TURNS:
+        raise ValueError(
+            f"Scenario {i} ({scenario_data['name']}): "
+            f"max_turns must be a positive integer, got {max_turns}"
+        )
+    if max_turns > MAX_MAX_TURNS:
+        logger.warning(
+            "Scenario %d (%s): max_turns=%d is unusually high (max recommended: %d)",
+            i,
+            scenario_data["name"],
+            max_turns,
+            MAX_MAX_TURNS,
+        )
+
+    # Validate persona
+    persona = scenario_data.get("persona", "polite")
+    if persona not in VALID_PERSONAS:
+        raise ValueError(
+            f"Scenario {i} ({scenario_data['name']}): "
+            f"invalid persona '{persona}'. "
+            f"Must be one of: {list(_VALID_PERSONAS_SORTED)}"
+        )
+
+    # Validate expected_topics is non-empty
+    expected_topics = scenario_data["expected_topics"]
+    if not isinstance(expected_topics, list) or len(expected_topics) == 0:
+        raise ValueError(
+            f"Scenario {i} ({scenario_data['name']}): "
+            "expected_topics must be a non-empty list"
+        )
+
+    # Intern the short, heavily-repeated strings (persona values and
+    # topic keywords recur across scenarios and across reloads) so all
+    # copies share one object and compare by pointer first. Long
+    # free-text fields are deliberately left alone.
+    persona = sys.intern(persona)
+    expected_topics = [sys.intern(t) for t in expected_topics]
+
+    # Parse conversation flow if present
+    conversation_flow = None
+    if scenario_data.get("conversation_flow"):
+        conversation_flow = [
+            ConversationFlowStep(
+                step["turn"],
+                step["expected_agent_action"],
+                step.get("user_response_hint"),
+            )
+            for step in scenario_data["conversation_flow"]
+        ]
+
+    # Positional construction with a bound .get: cheaper than kwargs
+    # on a loop that may run for hundreds of scenarios. Argument
+    # order mirrors the dataclass field order above.
+    get = scenario_data.get
+    return EvaluationScenario(
+        scenario_data["name"],
+        scenario_data["description"],
+        scenario_data["initial_query"],
+        expected_topics,
+        get("expected_tool_use", True),
+        persona,
+        max_turns,
+        get("user_context", ""),
+        get("user_goal", ""),
+        conversation_flow,
+        get("scenario_number"),
+    )
+
+
+@cache
 def get_default_scenarios_path() -> Path:
     """Get the path to the default scenarios JSON file.
 
+    Cached: the parent walk and Path joins allocate several strings and
+    the result never changes within a process.
+
     Returns:
         Path to default_scenarios.json in the scenarios directory.
     """
@@ -225,31 +316,30 @@ def _get_fallback_scenarios() -> list[EvaluationScenario]:
     ]
 
 
-# Default scenarios (loaded lazily)
-_default_scenarios: list[EvaluationScenario] | None = None
-
-
+@cache
 def get_evaluation_scenarios() -> list[EvaluationScenario]:
     """Get the default evaluation scenarios (lazy loading).
 
+    functools.cache replaces the old module-global-plus-None-check
+    pattern: the C-implemented cache is cheaper per call and safe under
+    concurrent workers.
+
     Returns:
         List of default evaluation scenarios.
     """
-    global _default_scenarios
-    if _default_scenarios is None:
-        _default_scenarios = load_default_scenarios()
-    return _default_scenarios
-
+    return load_default_scenarios()
 
-# For backward compatibility
-EVALUATION_SCENARIOS: list[EvaluationScenario] = []
 
+def __getattr__(name: str) -> list[EvaluationScenario]:
+    """Materialize EVALUATION_SCENARIOS lazily (PEP 562).
 
-def _init_default_scenarios() -> None:
-    """Initialize EVALUATION_SCENARIOS for backward compatibility."""
-    global EVALUATION_SCENARIOS
-    EVALUATION_SCENARIOS = load_default_scenarios()
-
-
-# Initialize on module load
-_init_default_scenarios()
+    The backward-compatibility constant used to be loaded eagerly on
+    import, which parsed the default scenarios JSON for every consumer
+    of this module. It is now built on first attribute access and then
+    cached in the module namespace.
+    """
+    if name == "EVALUATION_SCENARIOS":
+        scenarios = load_default_scenarios()
+        globals()["EVALUATION_SCENARIOS"] = scenarios
+        return scenarios
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
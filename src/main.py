@@ -1,17 +1,13 @@
 """Main entry point for agent evaluation."""
 
 import argparse
-from datetime import datetime
 from pathlib import Path
 
-from src.evaluation.dashboard import save_dashboard, save_results_json
-from src.evaluation.evaluator import (
-    print_conversation_detail,
-    print_evaluation_summary,
-    run_evaluation,
-)
+# The evaluator and dashboard (and their transitive strands/boto3/numpy
+# imports) are deferred into the branches that need them, so --help and
+# --list-scenarios stay near-instant. Only the lightweight scenarios
+# module is imported eagerly.
 from src.evaluation.scenarios import (
-    EVALUATION_SCENARIOS,
     get_default_scenarios_path,
     load_scenarios_from_json,
 )
@@ -114,6 +110,8 @@ def main() -> None:
             print(f"Version: {scenario_set.version}")
             print()
         else:
+            from src.evaluation.scenarios import EVALUATION_SCENARIOS
+
             scenarios = EVALUATION_SCENARIOS
 
         for scenario in scenarios:
@@ -144,6 +142,12 @@ def main() -> None:
     # Filter scenarios if specific one requested
     filter_scenario = args.scenario
 
+    from src.evaluation.evaluator import (
+        print_conversation_detail,
+        print_evaluation_summary,
+        run_evaluation,
+    )
+
     # Run evaluation
     print("Starting Agent Evaluation")
     print("=" * 60)
@@ -156,15 +160,18 @@ def main() -> None:
     if scenarios_json and scenarios_json.exists():
         print(f"Scenarios: {scenarios_json}")
 
-    # Load all scenarios first to filter
+    # Load only the requested scenario when filtering
     if filter_scenario:
         if scenarios_json and scenarios_json.exists():
-            scenario_set = load_scenarios_from_json(scenarios_json)
-            all_scenarios = scenario_set.scenarios
+            scenario_set = load_scenarios_from_json(
+                scenarios_json, filter_name=filter_scenario
+            )
+            filtered = scenario_set.scenarios
         else:
-            all_scenarios = EVALUATION_SCENARIOS
+            from src.evaluation.scenarios import EVALUATION_SCENARIOS
+
+            filtered = [s for s in EVALUATION_SCENARIOS if s.name == filter_scenario]
 
-        filtered = [s for s in all_scenarios if s.name == filter_scenario]
         if not filtered:
             print(f"Error: Scenario '{filter_scenario}' not found")
             print("Use --list-scenarios to see available scenarios")
@@ -201,20 +208,11 @@ def main() -> None:
 
     # Generate dashboard if requested
     if args.dashboard or args.open_dashboard:
-        # Create output directory
-        output_dir.mkdir(parents=True, exist_ok=True)
+        from src.evaluation.dashboard import save_all
 
-        # Generate timestamp for filenames
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Save HTML dashboard
-        dashboard_path = output_dir / f"dashboard_{timestamp}.html"
-        save_dashboard(results, dashboard_path)
+        # Save HTML dashboard and JSON results in one pass
+        dashboard_path, json_path = save_all(results, output_dir)
         print(f"\nDashboard saved: {dashboard_path}")
-
-        # Save JSON results
-        json_path = output_dir / f"results_{timestamp}.json"
-        save_results_json(results, json_path)
         print(f"Results JSON saved: {json_path}")
 
         # Open dashboard in browser if requested
@@ -14,17 +14,24 @@ logger = logging.getLogger(__name__)
 
 
 class ModelType(Enum):
-    """Available model types for the application."""
+    """Available model types for the application.
 
-    SONNET = "sonnet"
-    HAIKU = "haiku"
+    Each member carries its Bedrock model id directly, so resolving a
+    model id is an attribute read instead of a dict lookup, and the enum
+    itself guarantees only valid types exist.
+    """
+
+    SONNET = ("sonnet", "global.anthropic.claude-sonnet-4-5-20250929-v1:0")
+    HAIKU = ("haiku", "global.anthropic.claude-haiku-4-5-20251001-v1:0")
 
+    model_id: str
+
+    def __new__(cls, label: str, model_id: str) -> "ModelType":
+        obj = object.__new__(cls)
+        obj._value_ = label
+        obj.model_id = model_id
+        return obj
 
-# Model IDs for each model type
-MODEL_IDS = {
-    ModelType.SONNET: "global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-    ModelType.HAIKU: "global.anthropic.claude-haiku-4-5-20251001-v1:0",
-}
 
 # Cache for model instances (for singleton pattern)
 _model_cache: dict[ModelType, BedrockModel] = {}
@@ -42,14 +49,8 @@ def create_bedrock_model(model_type: ModelType) -> BedrockModel:
 
     Returns:
         A new BedrockModel instance.
-
-    Raises:
-        ValueError: If an unknown model type is provided.
     """
-    if model_type not in MODEL_IDS:
-        raise ValueError(f"Unknown model type: {model_type}")
-
-    model_id = MODEL_IDS[model_type]
+    model_id = model_type.model_id
     logger.debug(f"Creating new Bedrock model: {model_type.value} ({model_id})")
     return BedrockModel(model_id=model_id)
 
@@ -65,16 +66,11 @@ def get_shared_model(model_type: ModelType) -> BedrockModel:
 
     Returns:
         A shared BedrockModel instance.
-
-    Raises:
-        ValueError: If an unknown model type is provided.
     """
-    if model_type not in MODEL_IDS:
-        raise ValueError(f"Unknown model type: {model_type}")
-
-    # Fast path: already cached
-    if model_type in _model_cache:
-        return _model_cache[model_type]
+    # Fast path: a single dict lookup (atomic under the GIL)
+    cached = _model_cache.get(model_type)
+    if cached is not None:
+        return cached
 
     # Slow path: acquire lock and initialize
     with _model_cache_lock: